@@ -3,11 +3,14 @@
 """Executes arbitrary scripts passed in via TCP socket."""
 
 import argparse
-import datetime
+import collections
 import logging
 import os
 import queue
+import re
+import select
 import selectors
+import signal
 import socket
 import subprocess
 import sys
@@ -15,10 +18,44 @@ import threading
 import time
 import types
 
-from typing import Any, Callable, Generator, Optional, cast
+from typing import Any, Callable, List, Optional, Tuple, cast
 
 
-sel = selectors.DefaultSelector()
+# Module-level logger; avoids the root-logger lookup on every call.
+logger = logging.getLogger(__name__)
+
+# Prefer epoll where available: the kernel keeps a persistent interest
+# list, so readiness cost scales with events rather than registered fds
+# once many clients connect at once.
+sel: selectors.BaseSelector = (
+    selectors.EpollSelector()
+    if hasattr(selectors, 'EpollSelector')
+    else selectors.DefaultSelector())
+
+# 64 KB batches far more data per recv syscall than the old 4 KB slabs
+# while staying below glibc's mmap threshold for the pooled buffers.
+BUF_SIZE = 2**16
+
+# Cap on queued scripts so a flood of large submissions can't pin
+# unbounded memory while a long-running script executes.
+MAX_QUEUED_SCRIPTS = 64
+
+# Pool of receive buffers, shared by all connections. Reusing slabs keeps
+# steady-state allocations bounded by the number of active connections.
+buf_pool: collections.deque = collections.deque()
+
+
+def acquire_buffer() -> bytearray:
+  """Returns a receive buffer from the pool, allocating one if empty."""
+  try:
+    return buf_pool.popleft()
+  except IndexError:
+    return bytearray(BUF_SIZE)
+
+
+def release_buffer(buf: bytearray) -> None:
+  """Returns a receive buffer to the pool for reuse."""
+  buf_pool.append(buf)
 
 
 def define_flags() -> argparse.Namespace:
@@ -55,6 +92,20 @@ def define_flags() -> argparse.Namespace:
       default=False,
       help='reset and clear after keyboard interrupt',
   )
+  parser.add_argument(
+      '--parallel',
+      action='store',
+      default=1,
+      type=int,
+      help='number of scripts to execute concurrently',
+      metavar='COUNT',
+  )
+  parser.add_argument(
+      '--headless',
+      action='store_true',
+      default=False,
+      help='disable notifications and tab renames',
+  )
   parser.add_argument(
       '-V', '--version',
       action='version',
@@ -78,14 +129,45 @@ def check_flags(parser: argparse.ArgumentParser, args: argparse.Namespace) -> No
   # See: http://docs.python.org/3/library/argparse.html#exiting-methods
   if not args.socket:
     parser.error('--socket file required')
+  if args.parallel < 1:
+    parser.error('--parallel must be at least 1')
 
 
 CMD = os.path.splitext(os.path.basename(sys.argv[0]))[0]
 
+# The environment of this long-lived process doesn't change, so look these
+# up once instead of on every notification.
+IN_TMUX = bool(os.getenv('TMUX'))
+TMUX_PANE = os.getenv('TMUX_PANE', '')
+IS_XTERM = os.getenv('TERM', '').startswith('xterm')
+
+# Set from --headless in main(); suppresses all notification output.
+headless = False
+
 NORMAL = 'normal'
 LOW = 'low'
 CRITICAL = 'critical'
 
+# Escape sequence framing for the xterm window title, preformatted as bytes
+# so the title write skips the buffered stdout layer.
+XTERM_TITLE_PREFIX = b'\x1B]0;'
+XTERM_TITLE_SUFFIX = b'\x07\n'
+
+# Full reset + clear screen/scrollback + home, equivalent to running the
+# external reset(1) and clear(1) binaries without two fork+execs.
+RESET_AND_CLEAR = b'\x1Bc\x1B[2J\x1B[3J\x1B[H'
+
+timestamp_cache = types.SimpleNamespace(sec=0, text='')
+
+
+def timestamp() -> str:
+  """Returns the current HH:MM:SS, cached per whole second."""
+  sec = int(time.time())
+  if sec != timestamp_cache.sec:
+    timestamp_cache.sec = sec
+    timestamp_cache.text = time.strftime('%H:%M:%S', time.localtime(sec))
+  return timestamp_cache.text
+
 
 def send_notification(
     msg: str,
@@ -102,22 +184,91 @@ def send_notification(
     category: A category for this notification.
     expire: Number of seconds to expire.
   """
-  now = datetime.datetime.now()
-  if os.getenv('TMUX'):
-    if urgency in {CRITICAL}:
-      subprocess.call(['tmux', 'display-message', ' ' + msg % args])
-  elif os.getenv('TERM', '').startswith('xterm'):
-    sys.stdout.write('\x1B]0;[{time}] {cmd}: {message}\x07\n'.format(
-        time=now.strftime('%H:%M:%S'),
-        cmd=CMD,
-        message=msg % args,
-    ))
-  if urgency in {NORMAL, CRITICAL}:
-    subprocess.call(['notify-send',
-                     '-u', urgency,
-                     '-c', category,
-                     '-t', str(expire),
-                     'efifo: %s' % (msg % args)])
+  if headless:
+    return
+  # Format once; every branch below wants the same rendered message.
+  text = msg % args
+  if IN_TMUX:
+    if urgency == CRITICAL:
+      tmux_command('display-message', ' ' + text)
+  elif IS_XTERM:
+    title = f'[{timestamp()}] {CMD}: {text}'
+    os.write(sys.stdout.fileno(),
+             XTERM_TITLE_PREFIX + title.encode() + XTERM_TITLE_SUFFIX)
+  if urgency == NORMAL or urgency == CRITICAL:
+    subprocess.Popen(['notify-send',
+                      '-u', urgency,
+                      '-c', category,
+                      '-t', str(expire),
+                      'efifo: ' + text],
+                     stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL)
+
+
+def ticker_status(msg: str, *args: Any) -> None:
+  """Fast path for the once-per-second Running ticker.
+
+  A LOW-urgency notification only ever updates the xterm title (tmux and
+  notify-send ignore it), so the ticker can skip the general
+  send_notification machinery — including the message formatting — when
+  there is no title to write.
+
+  Args:
+    msg: The message to show.
+    *args: Extra string formatting files for msg.
+  """
+  if headless or not IS_XTERM:
+    return
+  title = f'[{timestamp()}] {CMD}: {msg % args}'
+  os.write(sys.stdout.fileno(),
+           XTERM_TITLE_PREFIX + title.encode() + XTERM_TITLE_SUFFIX)
+
+
+# One persistent control-mode tmux client, started on first use. Each
+# status update then costs a pipe write instead of a fork+exec plus a
+# client/server round-trip.
+tmux_control = types.SimpleNamespace(proc=None, failed=False, lock=threading.Lock())
+
+
+def tmux_quote(arg: str) -> str:
+  """Quotes one argument for a tmux control-mode command line."""
+  return '"' + arg.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def tmux_command(*args: str) -> None:
+  """Runs a tmux command, preferring the control-mode connection.
+
+  Falls back to a one-shot fire-and-forget client whenever the control
+  connection can't be established or dies.
+
+  Args:
+    *args: The tmux command and its arguments.
+  """
+  with tmux_control.lock:
+    if tmux_control.proc is None and not tmux_control.failed:
+      # Attach a control-mode client to our own server. TMUX has to be
+      # scrubbed from the environment or tmux refuses the nested attach.
+      env = {k: v for k, v in os.environ.items() if k != 'TMUX'}
+      try:
+        tmux_control.proc = subprocess.Popen(['tmux', '-C', 'attach-session'],
+                                             stdin=subprocess.PIPE,
+                                             stdout=subprocess.DEVNULL,
+                                             stderr=subprocess.DEVNULL,
+                                             env=env)
+      except OSError:
+        tmux_control.failed = True
+    if tmux_control.proc is not None:
+      try:
+        line = ' '.join(tmux_quote(arg) for arg in args) + '\n'
+        tmux_control.proc.stdin.write(line.encode())
+        tmux_control.proc.stdin.flush()
+        return
+      except (OSError, ValueError):
+        tmux_control.failed = True
+        tmux_control.proc = None
+  subprocess.Popen(['tmux', *args],
+                   stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL)
 
 
 def rename_tab(msg: str, *args: Any) -> None:
@@ -127,46 +278,156 @@ def rename_tab(msg: str, *args: Any) -> None:
     msg: The message to show.
     *args: Extra string formatting files for msg.
   """
-  if not os.getenv('TMUX'):
+  if headless or not IN_TMUX:
     return
-  subprocess.call(['tmux', 'rename-window', '-t', os.getenv('TMUX_PANE', ''), msg % args])
+  tmux_command('rename-window', '-t', TMUX_PANE, msg % args)
 
 
-IGNORED_COMMANDS = {'cd'}
+IGNORED_COMMANDS = {b'cd'}
 
+# One precompiled scan over the script replaces the replace+split pipeline;
+# each match is a single command between semicolons/newlines.
+COMMAND_RE = re.compile(rb'[^;\n]+')
 
-def split_commands(s: str) -> Generator[str, None, None]:
-  for cmds in (t.split(';') for t in s.splitlines()):
-    for cmd in cmds:
-      yield cmd
+# Matches commands whose first word is ignored, without tokenizing them.
+IGNORED_RE = re.compile(
+    rb'\s*(?:' +
+    b'|'.join(sorted(re.escape(cmd) for cmd in IGNORED_COMMANDS)) +
+    rb')(?:\s|$)')
 
 
-def first_command(s: str) -> str:
-  for cmd in split_commands(s):
-    sp = cmd.split()
-    if not sp or sp[0] in IGNORED_COMMANDS:
-      continue
-    return sp[0]
-  return ''
+def parse_commands(s: bytes) -> Tuple[str, str]:
+  """Extracts the leading command and the display string in one pass.
 
+  Args:
+    s: The raw script.
 
-def display_commands(s: str) -> str:
+  Returns:
+    Tuple of the first command word and the '; '-joined display string.
+  """
+  first = ''
   ret = []
-  for cmd in split_commands(s):
-    sp = cmd.split()
-    if not sp or sp[0] in IGNORED_COMMANDS:
+  for m in COMMAND_RE.finditer(s):
+    cmd = m.group().strip()
+    if not cmd or IGNORED_RE.match(cmd):
       continue
-    ret.append(cmd.strip())
+    if not first:
+      # The only split left runs once, on the first kept command.
+      first = cmd.split(None, 1)[0].decode(errors='replace')
+    ret.append(cmd.decode(errors='replace'))
   if not ret:
-    return '<empty>'
-  return '; '.join(ret)
+    return first, '<empty>'
+  return first, '; '.join(ret)
 
 
 executions = 0
 
 
+class BashProcess:
+  """A bash child spawned via posix_spawn, with a pipe to its stdin."""
+
+  __slots__ = ('pid', 'stdin_fd', 'returncode')
+
+  def __init__(self, pid: int, stdin_fd: int) -> None:
+    self.pid = pid
+    self.stdin_fd = stdin_fd
+    self.returncode: Optional[int] = None
+
+  def __repr__(self) -> str:
+    return f'BashProcess(pid={self.pid})'
+
+  def poll(self) -> Optional[int]:
+    if self.returncode is None:
+      pid, status = os.waitpid(self.pid, os.WNOHANG)
+      if pid:
+        self.returncode = os.waitstatus_to_exitcode(status)
+    return self.returncode
+
+  def wait(self) -> int:
+    if self.returncode is None:
+      _, status = os.waitpid(self.pid, 0)
+      self.returncode = os.waitstatus_to_exitcode(status)
+    return self.returncode
+
+  def terminate(self) -> None:
+    os.kill(self.pid, signal.SIGTERM)
+
+
+def spawn_bash() -> BashProcess:
+  """Spawns `bash -x` reading its script from a pipe.
+
+  posix_spawn skips the fd plumbing subprocess.Popen does in Python and,
+  on glibc, avoids duplicating the parent's page tables, which matters
+  once this process has been resident for a while.
+
+  Returns:
+    The spawned BashProcess.
+  """
+  pipe_r, pipe_w = os.pipe()
+  try:
+    pid = os.posix_spawnp('bash', ['bash', '-x'], dict(os.environ), file_actions=[
+        (os.POSIX_SPAWN_DUP2, pipe_r, 0),
+        (os.POSIX_SPAWN_CLOSE, pipe_w),
+    ])
+  finally:
+    os.close(pipe_r)
+  return BashProcess(pid, pipe_w)
+
+
+def wait_process(p: BashProcess,
+                 args: argparse.Namespace,
+                 interrupt: Optional[threading.Event],
+                 tick: Callable[[], None]) -> bool:
+  """Waits for the child, calling tick between health checks.
+
+  Blocks on the child's pidfd where the platform supports it, so exit is
+  noticed immediately instead of on the next polling interval; otherwise
+  falls back to polling.
+
+  Args:
+    p: The running bash process.
+    args: Main program args.
+    interrupt: When set, kill the running process.
+    tick: Called once per wakeup while the child is alive.
+
+  Returns:
+    True if the process was killed by an interrupt.
+  """
+  pidfd = -1
+  ep = None
+  if hasattr(os, 'pidfd_open'):
+    try:
+      pidfd = os.pidfd_open(p.pid)
+      ep = select.epoll()
+      ep.register(pidfd, select.EPOLLIN)
+    except OSError:
+      pidfd = -1
+      ep = None
+  try:
+    while p.poll() is None:
+      if interrupt and interrupt.is_set():
+        logger.warning('Killing process %s..', p)
+        p.terminate()
+        p.wait()
+        return True
+      tick()
+      if ep is not None:
+        # The pidfd becomes readable the instant the child exits.
+        ep.poll(args.polling_interval)
+      elif interrupt:
+        interrupt.wait(args.polling_interval)
+      else:
+        time.sleep(args.polling_interval)
+  finally:
+    if ep is not None:
+      ep.close()
+    if pidfd >= 0:
+      os.close(pidfd)
+  return False
+
+
 def execute_bash(args: argparse.Namespace,
-                 script: str,
+                 script: bytes,
                  interrupt: Optional[threading.Event] = None) -> Optional[int]:
   """Execute this bash script.
 
@@ -180,36 +441,63 @@ def execute_bash(args: argparse.Namespace,
   """
   global executions
   executions += 1
-  display = display_commands(script)
+  # Parsing walks the entire script; skip it when nobody will see the
+  # result.
+  if headless:
+    first, display = '', '<headless>'
+  else:
+    first, display = parse_commands(script)
   send_notification('Running: %s [%d]', display, executions, urgency=LOW)
-  cmd = os.path.basename(first_command(script))
+  cmd = os.path.basename(first) if IN_TMUX and first else 'bash'
   rename_tab('%s..' % cmd)
   start = time.time()
-  p = subprocess.Popen(['bash', '-x'], stdin=subprocess.PIPE, text=True)
-  proc = types.SimpleNamespace(killed=False)
-
-  def poll() -> None:
-    while p.poll() is None:
-      if interrupt and interrupt.is_set():
-        logging.warning(f'Killing process {p}..')
-        p.terminate()
-        proc.killed = True
+  # bash consumes bytes; keeping the script binary end-to-end avoids a
+  # decode in serve() and a re-encode here.
+  p = spawn_bash()
+
+  # Nothing is captured from stdout/stderr, so communicate()'s pumping
+  # machinery is overkill; feed bash its script and wait. The feed is
+  # non-blocking: a script larger than the pipe buffer would otherwise
+  # stall this thread (and the ticker) until bash drained it.
+  stdin_fd = p.stdin_fd
+  os.set_blocking(stdin_fd, False)
+  pipe = types.SimpleNamespace(view=memoryview(script), offset=0, open=True)
+
+  def feed() -> None:
+    if not pipe.open:
+      return
+    while pipe.offset < len(pipe.view):
+      try:
+        pipe.offset += os.write(stdin_fd, pipe.view[pipe.offset:])
+      except BlockingIOError:
+        # Pipe full; the wait loop retries on the next wakeup.
         return
-      send_notification('Running: %s %ds [%d]',
-                        display,
-                        time.time() - start,
-                        executions,
-                        urgency=LOW)
-      time.sleep(args.polling_interval)
-
-  t = threading.Thread(target=poll)
-  t.start()
-
-  p.communicate(input=script)
+      except BrokenPipeError:
+        # bash exited without reading the rest; nothing left to feed.
+        break
+    os.close(stdin_fd)
+    pipe.open = False
+
+  feed()
+
+  ticker = types.SimpleNamespace(last_sec=-1)
+
+  def tick() -> None:
+    feed()
+    # The ticker only displays whole seconds, so re-sending it more than
+    # once per second just forks redundant notify-send processes.
+    sec = int(time.time() - start)
+    if sec != ticker.last_sec:
+      ticker.last_sec = sec
+      ticker_status('Running: %s %ds [%d]', display, sec, executions)
+
+  killed = wait_process(p, args, interrupt, tick)
+  if pipe.open:
+    os.close(stdin_fd)
+    pipe.open = False
   elapsed = time.time() - start
-  t.join()
 
-  if proc.killed:
+  if killed:
     rename_tab(cmd)
     send_notification('KILLED: %s %0.2fs',
                       display,
@@ -241,65 +529,119 @@ def execute_bash(args: argparse.Namespace,
   return p.returncode
 
 
+class ConnectionData:
+  """Per-connection state tracked by the selector.
+
+  Slotted rather than a SimpleNamespace: no per-instance __dict__, so
+  each connection costs a fraction of the memory and attribute access in
+  serve() skips the dict lookup.
+  """
+
+  __slots__ = ('addr', 'read', 'write')
+
+  def __init__(self, addr: Any) -> None:
+    self.addr = addr
+    self.read = bytearray()
+    self.write = b''
+
+
 def accept(sock: socket.socket) -> None:
   """Accepts the socket connection."""
-  conn, addr = sock.accept()
-  # If this is a socket file the addr is going to be empty. Let's use the
-  # filename instead to have something to print.
-  if not addr:
-    addr = conn.getsockname()
-  logging.debug(f'Accepted connection on {addr}')
-  conn.setblocking(False)
-  data = types.SimpleNamespace(addr=addr, read=bytes(), write=bytes())
-  sel.register(conn, selectors.EVENT_READ, data=data)
+  # Accept everything pending in one wakeup; a connection storm would
+  # otherwise cost one selector round-trip per client.
+  while True:
+    try:
+      conn, addr = sock.accept()
+    except BlockingIOError:
+      return
+    # If this is a socket file the addr is going to be empty. Let's use the
+    # filename instead to have something to print.
+    if not addr:
+      addr = conn.getsockname()
+    logger.debug('Accepted connection on %s', addr)
+    conn.setblocking(False)
+    data = ConnectionData(addr)
+    sel.register(conn, selectors.EVENT_READ, data=data)
 
 
 def serve(key: selectors.SelectorKey,
           mask: int,
-          scripts: queue.Queue[str]) -> None:
-  """Serves the connection and adds to scripts Queue.
+          completed: List[bytes]) -> None:
+  """Serves the connection and collects finished scripts.
 
   Args:
     key: The selector key.
     mask: The selector mask.
-    scripts: The scripts queue.
+    completed: Scripts whose connections closed this wakeup; the caller
+      flushes them to the queue in one batch.
   """
   conn = cast(socket.socket, key.fileobj)
   data = key.data
   if mask & selectors.EVENT_READ:
-    buf = conn.recv(2**12)
-    if buf:
-      data.read += buf
-    else:
-      logging.debug(f'Closing connection to {data.addr}')
+    slab = acquire_buffer()
+    eof = False
+    # Drain everything the socket has to offer per wakeup instead of
+    # taking one selector round-trip per chunk.
+    while True:
+      try:
+        n = conn.recv_into(slab)
+      except BlockingIOError:
+        break
+      if not n:
+        eof = True
+        break
+      data.read.extend(memoryview(slab)[:n])
+    release_buffer(slab)
+    if eof:
+      logger.debug('Closing connection to %s', data.addr)
       sel.unregister(conn)
       conn.close()
-      # Scripts contains the various scripts to be executed.
-      scripts.put(data.read.decode())
+      completed.append(bytes(data.read))
   if mask & selectors.EVENT_WRITE:
     raise NotImplementedError('EVENT_WRITE is not written')
 
 
+def enqueue_scripts(scripts: queue.Queue[Optional[bytes]],
+                    completed: List[bytes]) -> None:
+  """Adds a batch of finished scripts to the queue under one lock.
+
+  When the queue overflows the oldest entries are dropped so the newest
+  work is kept.
+
+  Args:
+    scripts: The scripts queue.
+    completed: Scripts collected during one selector wakeup.
+  """
+  if not completed:
+    return
+  with scripts.mutex:
+    scripts.queue.extend(completed)
+    while len(scripts.queue) > scripts.maxsize:
+      scripts.queue.popleft()
+    scripts.not_empty.notify(len(completed))
+
+
 def dequeue(args: argparse.Namespace,
-            scripts: queue.Queue[str],
+            scripts: queue.Queue[Optional[bytes]],
             interrupt: threading.Event,
-            shutdown: threading.Event,
             callback: Callable[[Optional[int]], None]) -> None:
   """Dequeues events from the Queue and executes bash.
 
+  Blocks on the queue instead of polling; a None sentinel shuts the
+  thread down.
+
   Args:
     args: Main program args.
     scripts: The scripts queue.
     interrupt: When set, kill any running process.
-    shutdown: When set, shutdown this thread.
     callback: Callback function that takes the command status code as input.
   """
-  while not shutdown.is_set():
-    try:
-      retcode = execute_bash(args, scripts.get(timeout=args.polling_interval), interrupt=interrupt)
-      callback(retcode)
-    except queue.Empty:
-      pass
+  while True:
+    script = scripts.get()
+    if script is None:
+      break
+    retcode = execute_bash(args, script, interrupt=interrupt)
+    callback(retcode)
 
 
 def main(args: argparse.Namespace) -> int:
@@ -311,11 +653,14 @@ def main(args: argparse.Namespace) -> int:
   Returns:
     Status code.
   """
+  global headless
+  headless = args.headless
+
   if os.path.exists(args.socket):
     try:
       os.remove(args.socket)
     except OSError as e:
-      logging.error(e)
+      logger.error(e)
       return os.EX_UNAVAILABLE
   else:
     dirname = os.path.dirname(args.socket)
@@ -327,70 +672,85 @@ def main(args: argparse.Namespace) -> int:
 
   sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
   sock.bind(args.socket)
-  sock.listen(1)
+  # A backlog of 1 refuses clients under a connection storm; let the
+  # kernel hold a real queue of pending accepts instead.
+  sock.listen(64)
   sock.setblocking(False)
 
-  logging.info('Listening on %s', sock.getsockname())
+  logger.info('Listening on %s', sock.getsockname())
 
   sel.register(sock, selectors.EVENT_READ, data=None)
 
-  # This event is triggered when we shut everything down.
-  shutdown = threading.Event()
-
   # This event is triggered when we want to kill the subprocess.
   interrupt = threading.Event()
 
-  # This contains all of the scripts that need to be run.
-  scripts: queue.Queue[str] = queue.Queue()
+  # This contains all of the scripts that need to be run. A None sentinel
+  # shuts down the dequeue thread.
+  scripts: queue.Queue[Optional[bytes]] = queue.Queue(maxsize=MAX_QUEUED_SCRIPTS)
 
   proc = types.SimpleNamespace(interrupts=0)
 
+  def handle_sigint(signum: int, frame: Any) -> None:
+    send_notification('Keyboard Interrupt', category='interrupt', urgency=LOW)
+    if args.reset_and_clear:
+      os.write(sys.stdout.fileno(), RESET_AND_CLEAR)
+    proc.interrupts += 1
+    logger.warning('Keyboard Interrupt (%d of %d)', proc.interrupts, args.max_interrupts)
+    interrupt.set()
+
+  # sel.select() is transparently retried after EINTR (PEP 475), so the
+  # handler alone wouldn't wake the loop; the wakeup socketpair makes the
+  # select return so the interrupt count is rechecked.
+  wakeup_r, wakeup_w = socket.socketpair()
+  wakeup_r.setblocking(False)
+  wakeup_w.setblocking(False)
+  signal.set_wakeup_fd(wakeup_w.fileno())
+  sel.register(wakeup_r, selectors.EVENT_READ, data=wakeup_r)
+  signal.signal(signal.SIGINT, handle_sigint)
+
   def reset_interrupts(retcode: Optional[int]):
     if retcode is not None:
-      logging.debug('interrupts reset to 0')
+      logger.debug('interrupts reset to 0')
       proc.interrupts = 0
 
-  # This thread watches the queue and executes the scripts.
-  t = threading.Thread(target=dequeue, args=(
-      args,
-      scripts,
-      interrupt,
-      shutdown,
-      reset_interrupts,
-  ))
-  t.start()
+  # These threads watch the queue and execute the scripts. With the
+  # default --parallel 1 scripts run strictly in submission order; more
+  # workers let short scripts overtake a long-running one.
+  workers = []
+  for _ in range(args.parallel):
+    t = threading.Thread(target=dequeue, args=(
+        args,
+        scripts,
+        interrupt,
+        reset_interrupts,
+    ))
+    t.start()
+    workers.append(t)
 
   try:
     while proc.interrupts < args.max_interrupts:
       interrupt.clear()
-      try:
-        events = sel.select()
-        for key, mask in events:
-          # If key.data is None, then you know it’s from the listening socket.
-          if key.data is None:
-            accept(cast(socket.socket, key.fileobj))
-          else:
-            serve(key, mask, scripts)
-
-      except KeyboardInterrupt:
-        send_notification('Keyboard Interrupt', category='interrupt', urgency=LOW)
-        if args.reset_and_clear:
-          subprocess.call(['reset'])
-          subprocess.call(['clear'])
-        # print chr(27) + '[2J'
-        proc.interrupts += 1
-        logging.warning(f'Keyboard Interrupt ({proc.interrupts} of {args.max_interrupts})')
-        interrupt.set()
-
-  except KeyboardInterrupt:
-    print()
-    logging.warning('KeyboardInterrupt')
-    return os.EX_CANTCREAT
+      events = sel.select()
+      completed: List[bytes] = []
+      for key, mask in events:
+        if key.data is wakeup_r:
+          # Drain the signal wakeup bytes; the handler already ran.
+          wakeup_r.recv(BUF_SIZE)
+        # If key.data is None, then you know it’s from the listening socket.
+        elif key.data is None:
+          accept(cast(socket.socket, key.fileobj))
+        else:
+          serve(key, mask, completed)
+      enqueue_scripts(scripts, completed)
 
   finally:
+    signal.set_wakeup_fd(-1)
     sel.close()
-    shutdown.set()
-    t.join()
+    # One sentinel per worker; each consumes exactly one and exits.
+    for _ in workers:
+      scripts.put(None)
+    for t in workers:
+      t.join()
 
   return os.EX_OK
 